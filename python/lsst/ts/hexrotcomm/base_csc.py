@@ -31,7 +31,7 @@ import warnings
 from enum import IntEnum
 from pathlib import Path
 
-from lsst.ts import salobj, tcpip
+from lsst.ts import salobj, tcpip, utils
 from lsst.ts.xml.enums.MTHexapod import ControllerState, EnabledSubstate, ErrorCode
 
 from . import structs
@@ -178,6 +178,12 @@ class BaseCsc(salobj.ConfigurableCsc):
         # To avoid deadlocks: if acquiring both _command_lock and write_lock
         # then always acquire _command_lock first.
         self._command_lock = asyncio.Lock()
+
+        # Task that disables the CSC when basic_telemetry_callback sees
+        # that the CSC can no longer command the low-level controller.
+        # Only one such task runs at a time.
+        self._disable_task = utils.make_done_future()
+
         super().__init__(
             name=name,
             index=index,
@@ -718,11 +724,11 @@ class BaseCsc(salobj.ConfigurableCsc):
         disable_conditions = []
         if not self.evt_commandableByDDS.data.state:
             disable_conditions.append("the EUI has taken control")
-        if disable_conditions:
+        if disable_conditions and self._disable_task.done():
             why_str = ", ".join(disable_conditions)
             self.log.warning(f"Disabling the CSC because {why_str}")
             data = self.cmd_disable.DataType()
-            asyncio.create_task(
+            self._disable_task = asyncio.create_task(
                 self._do_change_state(
                     data, "disable", [salobj.State.ENABLED], salobj.State.DISABLED
                 )
@@ -24,7 +24,7 @@ import abc
 import asyncio
 import ctypes
 import logging
-import math
+import types
 import typing
 from enum import IntEnum
 
@@ -51,12 +51,20 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
     log : `logging.Logger`
         Logger.
     extra_commands : dict of command key: method
-        Device-specific commands, as a dict of command key (as returned by
-        `get_command_key`): method to call for that command.
+        Device-specific commands, as a dict of command key: method to call
+        for that command. The key is the command code, or a tuple of
+        (command code, param1) for SET_STATE and SET_ENABLED_SUBSTATE
+        commands (see `get_command_key`). Raise `ValueError` if a code or
+        param does not fit in a packed dispatch key (see `_pack_command_key`).
         Note: BaseMockController already supports the standard state
         transition commands, including CLEAR_ERROR.
         If the command is not done when the method returns,
         the method should return the predicted duration, in seconds.
+        The resulting ``command_table`` is compiled into an integer-keyed
+        dispatch table by the constructor and is read-only afterwards,
+        so add commands here.
+        The command struct passed to the method is reused for the next
+        command, so copy any fields needed after the method returns.
     CommandCode : `enum`
         Command codes.
     config : `ctypes.Structure`
@@ -94,6 +102,17 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
     # Interval between telemetry messages (seconds)
     telemetry_interval = 0.1
 
+    # Dict of controller state: enabled substate set by set_state;
+    # the enabled substate is 0 for states not in this dict.
+    _enabled_substate_for_state = {
+        ControllerState.ENABLED: EnabledSubstate.STATIONARY,
+    }
+
+    # States from which CLEAR_ERROR is accepted, as plain ints.
+    _clear_error_states = frozenset(
+        (ControllerState.FAULT.value, ControllerState.STANDBY.value)
+    )
+
     def __init__(
         self,
         log: logging.Logger,
@@ -109,8 +128,9 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         self.config = config
         self.telemetry = telemetry
 
-        # Dict of command key: command
-        self.command_table = {
+        # Dict of command key: command.
+        # Read-only, because run_command uses a dispatch table built from it.
+        command_table = {
             (CommandCode.SET_STATE, enums.SetStateParam.ENABLE): self.do_enable,  # type: ignore[attr-defined]
             (
                 CommandCode.SET_STATE,  # type: ignore[attr-defined]
@@ -122,7 +142,20 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
             ): self.do_clear_error,
             CommandCode.ENABLE_DRIVES: self.do_enable_drives,  # type: ignore[attr-defined]
         }
-        self.command_table.update(extra_commands)
+        command_table.update(extra_commands)
+        self.command_table = types.MappingProxyType(command_table)
+
+        # Command codes whose command key includes param1, as plain ints
+        # (used by get_command_key), and the bound lookup of command_table
+        # by packed integer key (see _pack_command_key).
+        self._set_state_code = int(CommandCode.SET_STATE)  # type: ignore[attr-defined]
+        self._set_enabled_substate_code = int(
+            CommandCode.SET_ENABLED_SUBSTATE  # type: ignore[attr-defined]
+        )
+        self._dispatch = {
+            self._pack_command_key(key): method
+            for key, method in self.command_table.items()
+        }.get
 
         # A dictionary of frame ID: header for command status,
         # telemetry and config data. Keeping separate headers for each
@@ -133,6 +166,14 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
             header = structs.Header()
             header.frame_id = frame_id
             self.headers[frame_id] = header
+        self._command_status_header = self.headers[enums.FrameId.COMMAND_STATUS]
+        self._config_header = self.headers[enums.FrameId.CONFIG]
+        self._telemetry_header = self.headers[enums.FrameId.TELEMETRY]
+
+        # Command read by read_and_dispatch and command status written by
+        # write_command_status; each is reused for every message.
+        self._command = structs.Command()
+        self._command_status = structs.CommandStatus()
 
         super().__init__(
             name="MockController",
@@ -161,12 +202,48 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
 
     def get_command_key(self, command: structs.Command) -> typing.Any:
         """Return the key to command_table."""
-        if command.code in (
-            self.CommandCode.SET_STATE,  # type: ignore[attr-defined]
-            self.CommandCode.SET_ENABLED_SUBSTATE,  # type: ignore[attr-defined]
-        ):
-            return (command.code, int(command.param1))  # type: ignore[attr-defined]
-        return command.code
+        code = command.code
+        if code == self._set_state_code or code == self._set_enabled_substate_code:
+            return (code, int(command.param1))
+        return code
+
+    def _get_dispatch_key(self, command: structs.Command) -> int:
+        """Return the packed dispatch key for a command.
+
+        Pack the key returned by `get_command_key` (see `_pack_command_key`).
+        Return -1, which matches no command, if the key cannot be packed.
+        """
+        try:
+            return self._pack_command_key(self.get_command_key(command))
+        except ValueError:
+            return -1
+
+    @staticmethod
+    def _pack_command_key(key: typing.Any) -> int:
+        """Pack a command_table key into a single int.
+
+        A ``(code, param)`` key is packed as ``(code << 16) | param``;
+        a plain ``code`` key is returned as an int.
+        Codes and params must be in the range [0, 65535], and the code
+        of a ``(code, param)`` key must not be 0, so that packed keys
+        never collide with plain codes.
+
+        Raises
+        ------
+        ValueError
+            If the code or param is out of range.
+        """
+        if isinstance(key, tuple):
+            code, param = int(key[0]), int(key[1])
+            if not 1 <= code <= 0xFFFF:
+                raise ValueError(f"code={code} in key={key} must be in [1, 65535]")
+            if not 0 <= param <= 0xFFFF:
+                raise ValueError(f"param={param} in key={key} must be in [0, 65535]")
+            return (code << 16) | param
+        code = int(key)
+        if not 0 <= code <= 0xFFFF:
+            raise ValueError(f"code={code} in key={key} must be in [0, 65535]")
+        return code
 
     def assert_state(
         self,
@@ -187,15 +264,19 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         CommandError
             If the state is not as expected.
         """
-        if self.state != state:
+        telemetry = self.telemetry
+        current_state = telemetry.state
+        if current_state != state:
             raise CommandError(
-                f"state={self.state!r}; must be {state!r} for this command."
-            )
-        if enabled_substate is not None and self.enabled_substate != enabled_substate:
-            raise CommandError(
-                f"enabled_substate={self.enabled_substate!r}; "
-                f"must be {enabled_substate!r} for this command."
+                f"state={current_state!r}; must be {state!r} for this command."
             )
+        if enabled_substate is not None:
+            current_enabled_substate = telemetry.enabled_substate
+            if current_enabled_substate != enabled_substate:
+                raise CommandError(
+                    f"enabled_substate={current_enabled_substate!r}; "
+                    f"must be {enabled_substate!r} for this command."
+                )
 
     async def do_enable_drives(self, command: structs.Command) -> None:
         self.config.drives_enabled = bool(command.param1)
@@ -213,12 +294,10 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         # The real low-level controller accepts this command if the
         # initial state is FAULT or STANDBY. Think of the command as
         # "clear error if there is one, and if it can be cleared".
-        if self.state not in (
-            ControllerState.FAULT,
-            ControllerState.STANDBY,
-        ):
+        current_state = self.telemetry.state
+        if current_state not in self._clear_error_states:
             raise CommandError(
-                f"state={self.state!r}; must be FAULT or STANDBY for this command."
+                f"state={current_state!r}; must be FAULT or STANDBY for this command."
             )
         self.set_state(ControllerState.STANDBY)
 
@@ -230,6 +309,8 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         command : `Command`
             The command to run.
             This method sets the commander and counter fields.
+            The struct is reused for the next command, so copy any fields
+            needed after this method returns.
 
         Returns
         -------
@@ -242,19 +323,20 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         CommandError
             If the command fails.
         """
-        self.log.debug(
-            "run_command: "
-            f"counter={command.counter}; "
-            f"command={self.CommandCode(command.code)!r}; "
-            f"param1={command.param1}; "
-            f"param2={command.param2}; "
-            f"param3={command.param3}; "
-            f"param4={command.param4}; "
-            f"param5={command.param5}; "
-            f"param6={command.param6}"
-        )
-        key = self.get_command_key(command)
-        cmd_method = self.command_table.get(key, None)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                "run_command: counter=%s; command=%r; param1=%s; param2=%s; "
+                "param3=%s; param4=%s; param5=%s; param6=%s",
+                command.counter,
+                self.CommandCode(command.code),
+                command.param1,
+                command.param2,
+                command.param3,
+                command.param4,
+                command.param5,
+                command.param6,
+            )
+        cmd_method = self._dispatch(self._get_dispatch_key(command))
         if cmd_method is None:
             raise CommandError(
                 f"Unrecognized command code {command.code}; param1={command.param1}..."
@@ -273,6 +355,9 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         """Called when run_command is done.
 
         Can be used to clear the set position.
+
+        The ``command`` struct is reused for the next command,
+        so copy any fields needed after this method returns.
         """
         raise NotImplementedError()
 
@@ -291,16 +376,16 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         * `lsst.ts.xml.enums.MTHexapod.EnabledSubstate.STATIONARY`
           if state == `lsst.ts.xml.enums.MTHexapod.ControllerState.ENABLED`
         """
-        self.telemetry.state = ControllerState(state)
-        self.telemetry.enabled_substate = (
-            EnabledSubstate.STATIONARY
-            if self.telemetry.state == ControllerState.ENABLED
-            else 0
-        )
-        self.log.debug(
-            f"set_state: state={ControllerState(self.telemetry.state)!r}; "
-            f"enabled_substate={EnabledSubstate(self.telemetry.enabled_substate)}"
-        )
+        if not isinstance(state, ControllerState):
+            state = ControllerState(state)
+        enabled_substate = self._enabled_substate_for_state.get(state, 0)
+        self.telemetry.state = state
+        self.telemetry.enabled_substate = enabled_substate
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                f"set_state: state={state!r}; "
+                f"enabled_substate={EnabledSubstate(enabled_substate)}"
+            )
 
     @abc.abstractmethod
     async def update_telemetry(self, curr_tai: float) -> None:
@@ -318,16 +403,26 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
     async def connect_callback(self, server: tcpip.OneClientReadLoopServer) -> None:
         """Called when the server connection state changes.
 
-        If connected: start the command and telemetry loops.
-        If not connected: stop the command and telemetry loops.
+        If connected: start the telemetry loop, unless it is running.
+        If not connected: stop the telemetry loop.
         """
-        self.telemetry_loop_task.cancel()
-        if self.connected:
+        if not self.connected:
+            self._cancel_telemetry_loop()
+        elif self.telemetry_loop_task.done():
             self.telemetry_loop_task = asyncio.create_task(self.telemetry_loop())
 
+    def _cancel_telemetry_loop(self) -> None:
+        """Cancel the telemetry loop and forget it.
+
+        Forgetting the cancelled task lets `connect_callback` start a new
+        loop even if a client connects before the old task has finished.
+        """
+        self.telemetry_loop_task.cancel()
+        self.telemetry_loop_task = utils.make_done_future()
+
     async def read_and_dispatch(self) -> None:
         """Read and execute one command."""
-        command = structs.Command()
+        command = self._command
         await self.read_into(command)
         try:
             duration = await self.run_command(command)
@@ -355,7 +450,7 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
 
     async def close_client(self, **kwargs: dict[str, typing.Any]) -> None:
         """Close the connected client (if any) and stop background tasks."""
-        self.telemetry_loop_task.cancel()
+        self._cancel_telemetry_loop()
         await super().close_client(**kwargs)
 
     async def telemetry_loop(self) -> None:
@@ -364,11 +459,23 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         try:
             if self.connected:
                 await self.write_config()
+            # Schedule each message on an absolute deadline,
+            # so the time spent writing telemetry does not add drift.
+            loop = asyncio.get_running_loop()
+            next_tick = loop.time()
             while self.connected:
-                header, curr_tai = self.update_and_get_header(enums.FrameId.TELEMETRY)
+                header, curr_tai = self._update_header(self._telemetry_header)
                 await self.update_telemetry(curr_tai=curr_tai)
-                await self.write_from(header, self.telemetry)
-                await asyncio.sleep(self.telemetry_interval)
+                await self.write_header_and_data(header, self.telemetry)
+                next_tick += self.telemetry_interval
+                delay = next_tick - loop.time()
+                if delay < 0:
+                    # Running late; drop the missed ticks rather than
+                    # sending a burst to catch up, and keep the cadence.
+                    missed_ticks = -(delay // self.telemetry_interval)
+                    next_tick += missed_ticks * self.telemetry_interval
+                    delay += missed_ticks * self.telemetry_interval
+                await asyncio.sleep(delay)
             self.log.info("Socket disconnected")
         except asyncio.CancelledError:
             raise
@@ -394,13 +501,51 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         curr_tai : `float`
             Current time in header timestamp (TAI, unix seconds).
         """
-        header = self.headers[frame_id]
+        return self._update_header(self.headers[frame_id])
+
+    def _update_header(self, header: structs.Header) -> tuple[structs.Header, float]:
+        """Update the timestamp of a header and return it and the time.
+
+        Parameters
+        ----------
+        header : `structs.Header`
+            Header to update; one of the values of ``self.headers``.
+
+        Returns
+        -------
+        header : `structs.Header`
+            The header.
+        curr_tai : `float`
+            Current time in header timestamp (TAI, unix seconds).
+        """
         curr_tai = utils.current_tai()
-        tai_frac, tai_sec = math.modf(curr_tai)
-        header.tai_sec = int(tai_sec)
-        header.tai_nsec = int(tai_frac * 1e9)
+        tai_sec = int(curr_tai)
+        header.tai_sec = tai_sec
+        header.tai_nsec = int((curr_tai - tai_sec) * 1e9)
         return header, curr_tai
 
+    async def write_header_and_data(
+        self, header: structs.Header, data: ctypes.Structure
+    ) -> None:
+        """Write a header and the data it describes as one message.
+
+        Joining the two structs makes a single write to the socket,
+        instead of one write per struct.
+
+        Parameters
+        ----------
+        header : `structs.Header`
+            Header.
+        data : `ctypes.Structure`
+            Configuration, telemetry or command status.
+
+        Raises
+        ------
+        ConnectionError
+            If not connected.
+        """
+        await self.write(b"".join((header, data)))
+
     async def write_config(self) -> None:
         """Write the current configuration.
 
@@ -409,8 +554,8 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         RuntimeError
             If not connected.
         """
-        header, curr_tai = self.update_and_get_header(enums.FrameId.CONFIG)
-        await self.write_from(header, self.config)
+        header, curr_tai = self._update_header(self._config_header)
+        await self.write_header_and_data(header, self.config)
 
     async def write_command_status(
         self,
@@ -440,11 +585,21 @@ class BaseMockController(tcpip.OneClientReadLoopServer, abc.ABC):
         """
         if duration is None:
             duration = 0
-        header, curr_tai = self.update_and_get_header(enums.FrameId.COMMAND_STATUS)
+        header, curr_tai = self._update_header(self._command_status_header)
         header.counter = counter
-        command_status = structs.CommandStatus(
-            status=status,
-            duration=duration,
-            reason=reason.encode()[0 : structs.COMMAND_STATUS_REASON_LEN],
+        command_status = self._command_status
+        command_status.status = status
+        command_status.duration = duration
+        # Zero the reason field first; assigning a shorter reason
+        # would leave the tail of the previous reason in place.
+        # That is all that is needed for the usual case of no reason.
+        ctypes.memset(
+            ctypes.addressof(command_status) + structs.CommandStatus.reason.offset,
+            0,
+            structs.COMMAND_STATUS_REASON_LEN,
         )
-        await self.write_from(header, command_status)
+        if reason:
+            command_status.reason = reason.encode()[
+                0 : structs.COMMAND_STATUS_REASON_LEN
+            ]
+        await self.write_header_and_data(header, command_status)
@@ -122,6 +122,13 @@ class CommandTelemetryClient(tcpip.Client):
         self.header = structs.Header()
         self.config = ConfigClass()
         self.telemetry = TelemetryClass()
+        # Number of bytes to flush if a header is not recognized.
+        # The size of the largest non-header struct.
+        self._max_flush_bytes = max(
+            ctypes.sizeof(self.telemetry),
+            ctypes.sizeof(self.config),
+            ctypes.sizeof(structs.CommandStatus),
+        )
         self.config_callback = config_callback
         self.telemetry_callback = telemetry_callback
         self.connect_timeout = connect_timeout
@@ -145,11 +152,22 @@ class CommandTelemetryClient(tcpip.Client):
         # is read.
         self._telemetry_task: asyncio.Future = asyncio.Future()
 
-        # Task used to wait for a command acknowledgement
+        # Task used to wait for a command acknowledgement.
+        # Its result is a tuple of (status, duration, reason) copied from
+        # ``_command_status``, which is reused for every command status read.
         self._read_command_status_task = utils.make_done_future()
+        self._command_status = structs.CommandStatus()
 
         self._read_loop_task = utils.make_done_future()
 
+        # Dict of frame_id: coroutine method that reads and handles
+        # the data that follows a header with that frame ID.
+        self._frame_handlers = {
+            enums.FrameId.COMMAND_STATUS: self._handle_command_status,
+            enums.FrameId.CONFIG: self._handle_config,
+            enums.FrameId.TELEMETRY: self._handle_telemetry,
+        }
+
         super().__init__(
             host=host,
             port=port,
@@ -179,53 +197,20 @@ class CommandTelemetryClient(tcpip.Client):
     async def read_loop(self) -> None:
         """Read from the Moog controller."""
         try:
-            # Number of bytes to flush if a header is not recognized.
-            # The size of the largest non-header struct.
-            max_flush_bytes = max(
-                ctypes.sizeof(self.telemetry),
-                ctypes.sizeof(self.config),
-                ctypes.sizeof(structs.CommandStatus),
-            )
+            header = self.header
+            get_handler = self._frame_handlers.get
 
             while self.connected:
-                await self.read_into(self.header)
-                if self.header.frame_id == enums.FrameId.COMMAND_STATUS:
-                    command_status = structs.CommandStatus()
-                    await self.read_into(command_status)
-                    if self._read_command_status_task.done():
-                        continue
-                    if self.header.counter == self._last_command.counter:
-                        self._read_command_status_task.set_result(command_status)
-                    else:
-                        self.log.warning(
-                            "Ignoring command status for wrong command; "
-                            f"read counter={self.header.counter} "
-                            f"!= expected value {self._last_command.counter}"
-                        )
-                elif self.header.frame_id == enums.FrameId.CONFIG:
-                    await self.read_into(self.config)
-                    try:
-                        await self.config_callback(self)
-                        if not self.configured_task.done():
-                            self.configured_task.set_result(None)
-                    except Exception as e:
-                        self.log.exception("config_callback failed.")
-                        if not self.configured_task.done():
-                            self.configured_task.set_exception(e)
-                elif self.header.frame_id == enums.FrameId.TELEMETRY:
-                    await self.read_into(self.telemetry)
-                    if not self._telemetry_task.done():
-                        self._telemetry_task.set_result(None)
-                    try:
-                        await self.telemetry_callback(self)
-                    except Exception:
-                        self.log.exception("telemetry_callback failed.")
+                await self.read_into(header)
+                handler = get_handler(header.frame_id)
+                if handler is not None:
+                    await handler()
                 else:
                     self.log.error(
-                        f"Invalid header read: unknown frame_id={self.header.frame_id}; "
-                        f"flushing and continuing. Bytes: {bytes(self.header)!r}"
+                        f"Invalid header read: unknown frame_id={header.frame_id}; "
+                        f"flushing and continuing. Bytes: {bytes(header)!r}"
                     )
-                    data = await self.read(max_flush_bytes)
+                    data = await self.read(self._max_flush_bytes)
                     self.log.info(f"Flushed {len(data)} bytes")
         except asyncio.CancelledError:
             # No need to close the connection, because the code that cancelled
@@ -237,10 +222,55 @@ class CommandTelemetryClient(tcpip.Client):
             self.log.exception("Unexpected error in read loop.")
         await self.basic_close()
 
+    async def _handle_command_status(self) -> None:
+        """Read a command status and report it to run_command,
+        if it is for the command being run.
+        """
+        command_status = self._command_status
+        await self.read_into(command_status)
+        if self._read_command_status_task.done():
+            return
+        if self.header.counter == self._last_command.counter:
+            self._read_command_status_task.set_result(
+                (
+                    command_status.status,
+                    command_status.duration,
+                    command_status.reason,
+                )
+            )
+        else:
+            self.log.warning(
+                "Ignoring command status for wrong command; "
+                f"read counter={self.header.counter} "
+                f"!= expected value {self._last_command.counter}"
+            )
+
+    async def _handle_config(self) -> None:
+        """Read configuration and call config_callback."""
+        await self.read_into(self.config)
+        try:
+            await self.config_callback(self)
+            if not self.configured_task.done():
+                self.configured_task.set_result(None)
+        except Exception as e:
+            self.log.exception("config_callback failed.")
+            if not self.configured_task.done():
+                self.configured_task.set_exception(e)
+
+    async def _handle_telemetry(self) -> None:
+        """Read telemetry and call telemetry_callback."""
+        await self.read_into(self.telemetry)
+        if not self._telemetry_task.done():
+            self._telemetry_task.set_result(None)
+        try:
+            await self.telemetry_callback(self)
+        except Exception:
+            self.log.exception("telemetry_callback failed.")
+
     async def next_telemetry(self) -> ctypes.Structure:
         """Wait for next telemetry."""
         if self._telemetry_task.done():
-            self._telemetry_task = asyncio.Future()
+            self._telemetry_task = asyncio.get_running_loop().create_future()
         await self._telemetry_task
         return self.telemetry
 
@@ -287,24 +317,23 @@ class CommandTelemetryClient(tcpip.Client):
             # Cancel the task just to be sure; it's hard to see how it
             # could be running at this point.
             self._read_command_status_task.cancel()
-            self._read_command_status_task = asyncio.Future()
+            self._read_command_status_task = asyncio.get_running_loop().create_future()
 
             command.commander = command.COMMANDER
             command.counter = self._last_command.counter + 1
             self._last_command = command
             await self.write_from(command)
 
-            command_status = await asyncio.wait_for(
+            status, duration, reason = await asyncio.wait_for(
                 self._read_command_status_task,
                 timeout=COMMAND_STATUS_TIMEOUT,
             )
-            if command_status.status == enums.CommandStatusCode.ACK:
-                return command_status.duration
-            elif command_status.status == enums.CommandStatusCode.NO_ACK:
-                reason = command_status.reason.decode()
-                raise salobj.ExpectedError(reason)
+            if status == enums.CommandStatusCode.ACK:
+                return duration
+            elif status == enums.CommandStatusCode.NO_ACK:
+                raise salobj.ExpectedError(reason.decode())
             else:
                 raise salobj.ExpectedError(
-                    f"Unknown command status {command_status.status}; "
+                    f"Unknown command status {status}; "
                     "low-level command assumed to have failed"
                 )
@@ -202,6 +202,27 @@ class CommandTelemetryClientTestCase(unittest.IsolatedAsyncioTestCase):
                 with pytest.raises(RuntimeError):
                     await client.start()
 
+    async def test_command_table(self) -> None:
+        async with self.make_mock_controller() as mock_ctrl:
+            key = (
+                mock_ctrl.CommandCode.SET_STATE,
+                hexrotcomm.SetStateParam.ENABLE,
+            )
+            assert mock_ctrl.command_table[key] == mock_ctrl.do_enable
+            with pytest.raises(TypeError):
+                mock_ctrl.command_table[key] = mock_ctrl.do_standby
+
+        # Command keys must fit in the packed dispatch key.
+        for bad_key in (
+            0x10000,
+            (0x10000, 0),
+            (0, 1),
+            (hexrotcomm.SimpleCommandCode.SET_STATE, 0x10000),
+        ):
+            with self.subTest(bad_key=bad_key):
+                with pytest.raises(ValueError):
+                    hexrotcomm.BaseMockController._pack_command_key(bad_key)
+
     async def test_client_reconnect(self) -> None:
         """Test that BaseMockController allows reconnection."""
         async with self.make_mock_controller() as mock_ctrl:
@@ -213,6 +234,28 @@ class CommandTelemetryClientTestCase(unittest.IsolatedAsyncioTestCase):
             async with self.make_client(mock_ctrl) as client:
                 assert mock_ctrl.connected
 
+    async def test_repeated_connect_callback(self) -> None:
+        """Test that a repeated connected callback does not restart
+        the mock controller's telemetry loop, unless it was cancelled.
+        """
+        async with self.make_mock_controller() as mock_ctrl:
+            async with self.make_client(mock_ctrl) as client:
+                await asyncio.wait_for(client.next_telemetry(), timeout=STD_TIMEOUT)
+                telemetry_loop_task = mock_ctrl.telemetry_loop_task
+                assert not telemetry_loop_task.done()
+                await mock_ctrl.connect_callback(mock_ctrl)
+                assert mock_ctrl.telemetry_loop_task is telemetry_loop_task
+                assert not telemetry_loop_task.done()
+
+                # A connected callback that arrives before a cancelled
+                # telemetry loop has finished must start a new loop.
+                mock_ctrl._cancel_telemetry_loop()
+                await mock_ctrl.connect_callback(mock_ctrl)
+                assert not telemetry_loop_task.done()
+                assert mock_ctrl.telemetry_loop_task is not telemetry_loop_task
+                assert not mock_ctrl.telemetry_loop_task.done()
+                await asyncio.wait_for(client.next_telemetry(), timeout=STD_TIMEOUT)
+
     async def test_move_command(self) -> None:
         async with self.make_mock_controller() as mock_ctrl, self.make_client(
             mock_ctrl
@@ -328,6 +371,33 @@ class CommandTelemetryClientTestCase(unittest.IsolatedAsyncioTestCase):
             # The client should still be connected
             assert client.connected
 
+            # Should fail if the command is not recognized,
+            # including a param1 that is too large to be a valid key.
+            bad_command = hexrotcomm.Command()
+            bad_command.code = hexrotcomm.SimpleCommandCode.SET_STATE
+            for bad_param1 in (
+                hexrotcomm.SetStateParam.INVALID,
+                -1,
+                0x10000 + hexrotcomm.SetStateParam.ENABLE,
+            ):
+                bad_command.param1 = bad_param1
+                with self.subTest(bad_param1=bad_param1):
+                    with pytest.raises(salobj.ExpectedError):
+                        await client.run_command(bad_command)
+
+            # Should fail if the code is too large to be a valid key,
+            # even if its low 16 bits are a valid command code.
+            bad_command.param1 = hexrotcomm.SetStateParam.ENABLE
+            for bad_code in (
+                0x10000 + hexrotcomm.SimpleCommandCode.SET_STATE,
+                (hexrotcomm.SimpleCommandCode.SET_STATE << 16)
+                | hexrotcomm.SetStateParam.ENABLE,
+            ):
+                bad_command.code = bad_code
+                with self.subTest(bad_code=bad_code):
+                    with pytest.raises(salobj.ExpectedError):
+                        await client.run_command(bad_command)
+
             # Should fail if command client is not connected
             await client.close()
             assert not client.connected
@@ -382,6 +452,23 @@ class CommandTelemetryClientTestCase(unittest.IsolatedAsyncioTestCase):
             assert len(command_status.reason) < len(too_long_reason_bytes)
             assert command_status.reason == too_long_reason_bytes[0:reason_len]
 
+            # A shorter reason must not leave any of the previous reason
+            # in the message.
+            short_reason_bytes = b"short"
+            await mock_ctrl.write_command_status(
+                counter=counter + 1,
+                status=hexrotcomm.CommandStatusCode.NO_ACK,
+                reason=short_reason_bytes.decode(),
+            )
+            header, command_status = await asyncio.wait_for(
+                self.next_command_status(client), timeout=STD_TIMEOUT
+            )
+            assert header.counter == counter + 1
+            assert command_status.reason == short_reason_bytes
+            assert bytes(command_status)[-reason_len:] == short_reason_bytes.ljust(
+                reason_len, b"\0"
+            )
+
     async def next_command_status(
         self, client: tcpip.Client
     ) -> tuple[hexrotcomm.Header, hexrotcomm.CommandStatus]:
@@ -20,6 +20,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import asyncio
 import pathlib
+import typing
 import unittest
 import unittest.mock
 
@@ -244,6 +245,50 @@ class TestSimpleCsc(hexrotcomm.BaseCscTestCase, unittest.IsolatedAsyncioTestCase
             )
             await self.assert_next_summary_state(salobj.State.DISABLED)
 
+    async def test_eui_takes_control_disables_once(self) -> None:
+        """Several telemetry messages while the EUI has control should
+        start a single transition to DISABLED.
+        """
+        async with self.make_csc(
+            initial_state=salobj.State.ENABLED,
+            simulation_mode=1,
+            config_dir=TEST_CONFIG_DIR,
+        ):
+            await self.assert_next_summary_state(salobj.State.ENABLED)
+            await self.assert_next_sample(
+                topic=self.remote.evt_commandableByDDS,
+                state=True,
+            )
+
+            # Slow down the transition to DISABLED,
+            # so that several telemetry messages arrive while it runs.
+            telemetry_interval = self.csc.mock_ctrl.telemetry_interval
+            do_change_state = self.csc._do_change_state
+            change_state_args = []
+
+            async def slow_do_change_state(*args: typing.Any) -> None:
+                change_state_args.append(args)
+                await asyncio.sleep(telemetry_interval * 5)
+                await do_change_state(*args)
+
+            with unittest.mock.patch.object(
+                self.csc, "_do_change_state", slow_do_change_state
+            ):
+                # Clear the DDS_COMMAND_SOURCE flag
+                self.csc.mock_ctrl.telemetry.application_status &= (
+                    ~ApplicationStatus.DDS_COMMAND_SOURCE
+                )
+                await self.assert_next_sample(
+                    topic=self.remote.evt_commandableByDDS,
+                    state=False,
+                )
+                await self.assert_next_summary_state(salobj.State.DISABLED)
+                # Give more telemetry time to arrive.
+                await asyncio.sleep(telemetry_interval * 3)
+
+            assert len(change_state_args) == 1
+            assert change_state_args[0][1] == "disable"
+
     async def move_sequentially(
         self, *positions: list[float], delay: float | None = None
     ) -> None: